@@ -4,8 +4,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
 
 # Set page config
 st.set_page_config(
@@ -33,116 +32,307 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-class ProjectAnalyticsDashboard:
-    def __init__(self):
-        self.projects = self.generate_sample_data()
-        self.stakeholder_feedback = self.generate_feedback_data()
+# Single seed for all synthetic data, so the whole dashboard is reproducible;
+# each generator derives its own independent stream from it
+RANDOM_SEED = 42
+
+# Data loaders read the clock (dates, days_remaining), so cached frames expire daily
+@st.cache_data(show_spinner=False, ttl="1d")
+def generate_sample_data(seed=RANDOM_SEED):
+    """Generate sample project data"""
+    rng = np.random.default_rng([seed, 0])
     
-    def generate_sample_data(self):
-        """Generate sample project data"""
-        np.random.seed(42)
-        projects = []
-        
-        project_names = [
-            "Digital Transformation Initiative", "Customer Portal Upgrade", 
-            "Mobile App Development", "Data Analytics Platform", 
-            "Cloud Migration Project", "Security Enhancement", 
-            "AI/ML Implementation", "Process Automation", 
-            "Infrastructure Modernization", "User Experience Redesign"
-        ]
-        
-        statuses = ["On Track", "At Risk", "Delayed", "Completed"]
-        phases = ["Planning", "Development", "Testing", "Deployment", "Maintenance"]
-        risk_levels = ["Low", "Medium", "High"]
-        
-        for i, name in enumerate(project_names):
-            start_date = datetime.now() - timedelta(days=random.randint(30, 365))
-            duration = random.randint(90, 365)
-            end_date = start_date + timedelta(days=duration)
-            
-            project = {
-                "project_id": f"PRJ-{1000 + i}",
-                "project_name": name,
-                "status": random.choice(statuses),
-                "phase": random.choice(phases),
-                "start_date": start_date.strftime("%Y-%m-%d"),
-                "end_date": end_date.strftime("%Y-%m-%d"),
-                "budget": random.randint(50000, 500000),
-                "spent": random.randint(20000, 400000),
-                "progress": random.randint(10, 100),
-                "risk_level": random.choice(risk_levels),
-                "team_size": random.randint(3, 15),
-                "stakeholder_satisfaction": random.uniform(2.5, 5.0),
-                "delay_days": random.randint(-10, 60) if random.choice([True, False]) else 0
-            }
-            
-            # Calculate derived metrics
-            project["budget_utilization"] = (project["spent"] / project["budget"]) * 100
-            project["days_remaining"] = (end_date - datetime.now()).days
-            project["cost_overrun"] = max(0, project["spent"] - project["budget"])
-            
-            projects.append(project)
-        
-        df = pd.DataFrame(projects)
-        # Convert date strings back to datetime for calculations
-        df['start_date'] = pd.to_datetime(df['start_date'])
-        df['end_date'] = pd.to_datetime(df['end_date'])
-        
-        return df
+    project_names = [
+        "Digital Transformation Initiative", "Customer Portal Upgrade", 
+        "Mobile App Development", "Data Analytics Platform", 
+        "Cloud Migration Project", "Security Enhancement", 
+        "AI/ML Implementation", "Process Automation", 
+        "Infrastructure Modernization", "User Experience Redesign"
+    ]
+    n = len(project_names)
     
-    def generate_feedback_data(self):
-        """Generate sample stakeholder feedback data"""
-        feedback_types = ["Quality", "Timeline", "Communication", "Budget", "Scope"]
-        sentiments = ["Positive", "Neutral", "Negative"]
-        
-        feedback = []
-        for _ in range(50):
-            feedback.append({
-                "project_id": random.choice(self.projects["project_id"].tolist()),
-                "feedback_type": random.choice(feedback_types),
-                "sentiment": random.choice(sentiments),
-                "rating": random.randint(1, 5),
-                "date": datetime.now() - timedelta(days=random.randint(1, 90)),
-                "comment": f"Sample feedback comment {random.randint(1, 100)}"
-            })
-        
-        return pd.DataFrame(feedback)
+    statuses = ["On Track", "At Risk", "Delayed", "Completed"]
+    phases = ["Planning", "Development", "Testing", "Deployment", "Maintenance"]
+    risk_levels = ["Low", "Medium", "High"]
     
-    def calculate_health_score(self, row):
-        """Calculate project health score based on multiple factors"""
-        score = 100
-        
-        # Budget factor
-        if row["budget_utilization"] > 100:
-            score -= 30
-        elif row["budget_utilization"] > 80:
-            score -= 15
-        
-        # Risk factor
-        risk_penalties = {"High": 25, "Medium": 15, "Low": 5}
-        score -= risk_penalties.get(row["risk_level"], 0)
-        
-        # Progress vs time factor (simplified calculation)
-        if row["progress"] < 50 and row["days_remaining"] < 30:
-            score -= 20
-        
-        # Delay factor
-        if row["delay_days"] > 0:
-            score -= min(20, row["delay_days"] / 5)
-        
-        return max(0, score)
+    # Build each column with a single vectorized draw
+    today = pd.Timestamp.now().normalize()
+    start_offsets = rng.integers(30, 366, n)
+    durations = rng.integers(90, 366, n)
+    start_dates = today - pd.to_timedelta(start_offsets, unit="D")
+    end_dates = start_dates + pd.to_timedelta(durations, unit="D")
+    
+    # Money columns stay int64 so totals cannot overflow; only small-range columns are downcast
+    budget = rng.integers(50000, 500001, n)
+    spent = rng.integers(20000, 400001, n)
+    is_delayed = rng.integers(0, 2, n).astype(bool)
+    delay_days = np.where(is_delayed, rng.integers(-10, 61, n, dtype=np.int32), 0).astype(np.int32)
+    
+    return pd.DataFrame({
+        "project_id": pd.array(np.char.add("PRJ-", np.arange(1000, 1000 + n).astype(str)), dtype="string[pyarrow]"),
+        "project_name": pd.array(project_names, dtype="string[pyarrow]"),
+        "status": pd.Categorical(rng.choice(statuses, n), categories=statuses),
+        "phase": pd.Categorical(rng.choice(phases, n), categories=phases),
+        "start_date": start_dates,
+        "end_date": end_dates,
+        "budget": budget,
+        "spent": spent,
+        "progress": rng.integers(10, 101, n, dtype=np.int32),
+        "risk_level": pd.Categorical(rng.choice(risk_levels, n), categories=risk_levels),
+        "team_size": rng.integers(3, 16, n, dtype=np.int32),
+        "stakeholder_satisfaction": rng.uniform(2.5, 5.0, n).astype(np.float32),
+        "delay_days": delay_days,
+        # Derived metrics
+        "budget_utilization": (spent / budget * 100).astype(np.float32),
+        "days_remaining": (end_dates - today).days.astype(np.int32),
+        "cost_overrun": np.maximum(0, spent - budget)
+    })
+
+@st.cache_data(show_spinner=False, ttl="1d")
+def generate_feedback_data(project_ids, seed=RANDOM_SEED):
+    """Generate sample stakeholder feedback data"""
+    feedback_types = ["Quality", "Timeline", "Communication", "Budget", "Scope"]
+    sentiments = ["Positive", "Neutral", "Negative"]
+    
+    rng = np.random.default_rng([seed, 1])
+    n = 50
+    
+    day_offsets = rng.integers(1, 91, n)
+    comment_ids = rng.integers(1, 101, n)
+    
+    return pd.DataFrame({
+        "project_id": pd.array(rng.choice(np.asarray(project_ids), n), dtype="string[pyarrow]"),
+        "feedback_type": pd.Categorical(rng.choice(feedback_types, n), categories=feedback_types),
+        "sentiment": pd.Categorical(rng.choice(sentiments, n), categories=sentiments),
+        "rating": rng.integers(1, 6, n),
+        "date": pd.Timestamp.now() - pd.to_timedelta(day_offsets, unit="D"),
+        "comment": pd.array(np.char.add("Sample feedback comment ", comment_ids.astype(str)), dtype="string[pyarrow]")
+    })
+
+def compute_health_scores(df):
+    """Calculate project health scores for every project in one vectorized pass"""
+    score = np.full(len(df), 100.0)
+    
+    # Budget factor
+    utilization = df["budget_utilization"].to_numpy()
+    score -= np.where(utilization > 100, 30, np.where(utilization > 80, 15, 0))
+    
+    # Risk factor
+    risk = df["risk_level"]
+    score -= np.select(
+        [(risk == "High").to_numpy(), (risk == "Medium").to_numpy(), (risk == "Low").to_numpy()],
+        [25, 15, 5],
+        default=0
+    )
+    
+    # Progress vs time factor (simplified calculation)
+    behind_schedule = (df["progress"].to_numpy() < 50) & (df["days_remaining"].to_numpy() < 30)
+    score -= np.where(behind_schedule, 20, 0)
+    
+    # Delay factor
+    score -= np.minimum(20, np.maximum(0, df["delay_days"].to_numpy()) / 5)
+    
+    return pd.Series(np.clip(score, 0, None), index=df.index, name="health_score")
+
+def count_observed(values):
+    """Count values of a column, leaving out categories with no rows"""
+    counts = values.value_counts()
+    return counts[counts > 0]
+
+@st.cache_data(show_spinner=False, ttl="1d")
+def load_projects():
+    """Load sample project data with its derived health score and high-risk flag"""
+    projects = generate_sample_data()
+    projects["health_score"] = compute_health_scores(projects)
+    projects["high_risk"] = (
+        (projects["risk_level"] == "High") |
+        (projects["budget_utilization"] > 90) |
+        (projects["delay_days"] > 30)
+    )
+    
+    return projects
+
+# Figure builders are cached on their (numpy/tuple) inputs so untouched panels skip Plotly work on rerun
+
+@st.cache_data(show_spinner=False)
+def _fig_health(health_scores):
+    """Build the health score distribution histogram"""
+    fig = px.histogram(
+        pd.DataFrame({"health_score": health_scores}),
+        x="health_score",
+        nbins=10,
+        title="Project Health Score Distribution",
+        color_discrete_sequence=["#3498db"]
+    )
+    fig.update_layout(
+        xaxis_title="Health Score",
+        yaxis_title="Number of Projects"
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _fig_risk(risk_levels, counts):
+    """Build the risk level distribution pie chart"""
+    return px.pie(
+        values=counts,
+        names=risk_levels,
+        title="Project Risk Distribution",
+        color_discrete_map={"High": "#e74c3c", "Medium": "#f39c12", "Low": "#27ae60"}
+    )
+
+@st.cache_data(show_spinner=False)
+def _fig_budget(project_names, budget, spent):
+    """Build the budget vs spent bar chart"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='Budget',
+        x=project_names,
+        y=budget,
+        marker_color='lightblue'
+    ))
+    fig.add_trace(go.Bar(
+        name='Spent',
+        x=project_names,
+        y=spent,
+        marker_color='darkblue'
+    ))
+    
+    fig.update_layout(
+        title="Budget vs Actual Spending by Project",
+        xaxis_title="Projects",
+        yaxis_title="Amount ($)",
+        barmode='group',
+        xaxis_tickangle=-45
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _fig_utilization(project_names, progress, budget_utilization, team_size, risk_levels):
+    """Build the progress vs budget utilization scatter plot"""
+    fig = px.scatter(
+        pd.DataFrame({
+            "project_name": project_names,
+            "progress": progress,
+            "budget_utilization": budget_utilization,
+            "team_size": team_size,
+            "risk_level": risk_levels
+        }),
+        x="progress",
+        y="budget_utilization",
+        size="team_size",
+        color="risk_level",
+        hover_data=["project_name"],
+        title="Progress vs Budget Utilization",
+        color_discrete_map={"High": "#e74c3c", "Medium": "#f39c12", "Low": "#27ae60"}
+    )
+    fig.add_hline(y=100, line_dash="dash", line_color="red", 
+                  annotation_text="Budget Limit")
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _fig_status(statuses, counts):
+    """Build the project status distribution pie chart"""
+    return px.pie(
+        values=counts,
+        names=statuses,
+        title="Project Status Distribution",
+        color_discrete_map={
+            "On Track": "#27ae60",
+            "At Risk": "#f39c12",
+            "Delayed": "#e74c3c",
+            "Completed": "#95a5a6"
+        }
+    )
+
+@st.cache_data(show_spinner=False)
+def _fig_delay(project_names, delay_days):
+    """Build the project delay bar chart"""
+    fig = px.bar(
+        pd.DataFrame({"project_name": project_names, "delay_days": delay_days}),
+        x="project_name",
+        y="delay_days",
+        title="Project Delays (Days)",
+        color="delay_days",
+        color_continuous_scale="Reds"
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _fig_sentiment(dates, sentiments, counts):
+    """Build the feedback sentiment trend line chart"""
+    return px.line(
+        pd.DataFrame({"date": dates, "sentiment": sentiments, "count": counts}),
+        x="date",
+        y="count",
+        color="sentiment",
+        title="Stakeholder Feedback Sentiment Trends",
+        color_discrete_map={
+            "Positive": "#27ae60",
+            "Neutral": "#3498db",
+            "Negative": "#e74c3c"
+        }
+    )
+
+@st.cache_data(show_spinner=False)
+def _fig_category(feedback_types, sentiments, counts):
+    """Build the feedback by category bar chart"""
+    return px.bar(
+        pd.DataFrame({"feedback_type": feedback_types, "sentiment": sentiments, "count": counts}),
+        x="feedback_type",
+        y="count",
+        color="sentiment",
+        title="Feedback Distribution by Category",
+        color_discrete_map={
+            "Positive": "#27ae60",
+            "Neutral": "#3498db",
+            "Negative": "#e74c3c"
+        }
+    )
+
+@st.cache_data(show_spinner=False)
+def _fig_risk_matrix(project_names, budget_utilization, delay_days, team_size, risk_levels, health_scores):
+    """Build the budget utilization vs delay risk matrix"""
+    fig = px.scatter(
+        pd.DataFrame({
+            "project_name": project_names,
+            "budget_utilization": budget_utilization,
+            "delay_days": delay_days,
+            "team_size": team_size,
+            "risk_level": risk_levels,
+            "health_score": health_scores
+        }),
+        x="budget_utilization",
+        y="delay_days",
+        size="team_size",
+        color="risk_level",
+        hover_data=["project_name", "health_score"],
+        title="Risk Matrix: Budget Utilization vs Delays",
+        color_discrete_map={"High": "#e74c3c", "Medium": "#f39c12", "Low": "#27ae60"}
+    )
     
-    def render_overview_metrics(self):
+    fig.add_vline(x=100, line_dash="dash", line_color="red")
+    fig.add_hline(y=30, line_dash="dash", line_color="red")
+    fig.add_annotation(x=110, y=45, text="High Risk Zone", 
+                       showarrow=False, bgcolor="rgba(255,0,0,0.1)")
+    return fig
+
+class ProjectAnalyticsDashboard:
+    def __init__(self):
+        # Health scores are memoized on the cached frame, so they are computed once per session
+        self.projects = load_projects()
+        self.stakeholder_feedback = generate_feedback_data(tuple(self.projects["project_id"]))
+    
+    def render_overview_metrics(self, projects):
         """Render key performance indicators"""
         st.subheader("📈 Key Performance Indicators")
         
         col1, col2, col3, col4, col5 = st.columns(5)
         
-        total_projects = len(self.projects)
-        active_projects = len(self.projects[self.projects["status"] != "Completed"])
-        avg_health = self.projects.apply(self.calculate_health_score, axis=1).mean()
-        total_budget = self.projects["budget"].sum()
-        total_spent = self.projects["spent"].sum()
+        total_projects = len(projects)
+        active_projects = len(projects[projects["status"] != "Completed"])
+        avg_health = projects["health_score"].mean()
+        total_budget, total_spent = projects[["budget", "spent"]].to_numpy().sum(axis=0, dtype=np.int64)
         
         with col1:
             st.metric("Total Projects", total_projects)
@@ -151,50 +341,39 @@ class ProjectAnalyticsDashboard:
             st.metric("Active Projects", active_projects)
         
         with col3:
-            st.metric("Avg Health Score", f"{avg_health:.1f}")
+            # The mean of an empty selection is NaN
+            if total_projects:
+                st.metric("Avg Health Score", f"{avg_health:.1f}")
+            else:
+                st.metric("Avg Health Score", "N/A")
         
         with col4:
             st.metric("Total Budget", f"${total_budget:,.0f}")
         
         with col5:
-            st.metric("Budget Utilization", f"{(total_spent/total_budget)*100:.1f}%")
+            # Filters can leave no projects selected, so guard against a zero budget
+            if total_budget:
+                st.metric("Budget Utilization", f"{(total_spent/total_budget)*100:.1f}%")
+            else:
+                st.metric("Budget Utilization", "N/A")
     
-    def render_project_health_overview(self):
+    def render_project_health_overview(self, projects, risk_counts):
         """Render project health overview charts"""
         st.subheader("🎯 Project Health Overview")
         
-        # Calculate health scores
-        self.projects["health_score"] = self.projects.apply(self.calculate_health_score, axis=1)
-        
         col1, col2 = st.columns(2)
         
         with col1:
             # Health score distribution
-            fig_health = px.histogram(
-                self.projects, 
-                x="health_score",
-                nbins=10,
-                title="Project Health Score Distribution",
-                color_discrete_sequence=["#3498db"]
-            )
-            fig_health.update_layout(
-                xaxis_title="Health Score",
-                yaxis_title="Number of Projects"
-            )
+            fig_health = _fig_health(projects["health_score"].to_numpy())
             st.plotly_chart(fig_health, use_container_width=True)
         
         with col2:
             # Risk level distribution
-            risk_counts = self.projects["risk_level"].value_counts()
-            fig_risk = px.pie(
-                values=risk_counts.values,
-                names=risk_counts.index,
-                title="Project Risk Distribution",
-                color_discrete_map={"High": "#e74c3c", "Medium": "#f39c12", "Low": "#27ae60"}
-            )
+            fig_risk = _fig_risk(tuple(risk_counts.index), risk_counts.to_numpy())
             st.plotly_chart(fig_risk, use_container_width=True)
     
-    def render_cost_analysis(self):
+    def render_cost_analysis(self, projects):
         """Render cost and budget analysis"""
         st.subheader("💰 Cost & Budget Analysis")
         
@@ -202,46 +381,25 @@ class ProjectAnalyticsDashboard:
         
         with col1:
             # Budget vs Spent
-            fig_budget = go.Figure()
-            fig_budget.add_trace(go.Bar(
-                name='Budget',
-                x=self.projects["project_name"],
-                y=self.projects["budget"],
-                marker_color='lightblue'
-            ))
-            fig_budget.add_trace(go.Bar(
-                name='Spent',
-                x=self.projects["project_name"],
-                y=self.projects["spent"],
-                marker_color='darkblue'
-            ))
-            
-            fig_budget.update_layout(
-                title="Budget vs Actual Spending by Project",
-                xaxis_title="Projects",
-                yaxis_title="Amount ($)",
-                barmode='group',
-                xaxis_tickangle=-45
+            fig_budget = _fig_budget(
+                tuple(projects["project_name"]),
+                projects["budget"].to_numpy(),
+                projects["spent"].to_numpy()
             )
             st.plotly_chart(fig_budget, use_container_width=True)
         
         with col2:
             # Budget utilization scatter
-            fig_util = px.scatter(
-                self.projects,
-                x="progress",
-                y="budget_utilization",
-                size="team_size",
-                color="risk_level",
-                hover_data=["project_name"],
-                title="Progress vs Budget Utilization",
-                color_discrete_map={"High": "#e74c3c", "Medium": "#f39c12", "Low": "#27ae60"}
+            fig_util = _fig_utilization(
+                tuple(projects["project_name"]),
+                projects["progress"].to_numpy(),
+                projects["budget_utilization"].to_numpy(),
+                projects["team_size"].to_numpy(),
+                tuple(projects["risk_level"])
             )
-            fig_util.add_hline(y=100, line_dash="dash", line_color="red", 
-                              annotation_text="Budget Limit")
             st.plotly_chart(fig_util, use_container_width=True)
     
-    def render_timeline_analysis(self):
+    def render_timeline_analysis(self, projects, status_counts):
         """Render timeline and delay analysis"""
         st.subheader("⏱️ Timeline & Delay Analysis")
         
@@ -249,42 +407,26 @@ class ProjectAnalyticsDashboard:
         
         with col1:
             # Project status distribution over time
-            status_counts = self.projects['status'].value_counts()
-            fig_status = px.pie(
-                values=status_counts.values,
-                names=status_counts.index,
-                title="Project Status Distribution",
-                color_discrete_map={
-                    "On Track": "#27ae60",
-                    "At Risk": "#f39c12",
-                    "Delayed": "#e74c3c",
-                    "Completed": "#95a5a6"
-                }
-            )
+            fig_status = _fig_status(tuple(status_counts.index), status_counts.to_numpy())
             st.plotly_chart(fig_status, use_container_width=True)
         
         with col2:
             # Delay analysis
-            delayed_projects = self.projects[self.projects["delay_days"] > 0]
+            delayed_projects = projects[projects["delay_days"] > 0]
             if not delayed_projects.empty:
-                fig_delay = px.bar(
-                    delayed_projects,
-                    x="project_name",
-                    y="delay_days",
-                    title="Project Delays (Days)",
-                    color="delay_days",
-                    color_continuous_scale="Reds"
+                fig_delay = _fig_delay(
+                    tuple(delayed_projects["project_name"]),
+                    delayed_projects["delay_days"].to_numpy()
                 )
-                fig_delay.update_layout(xaxis_tickangle=-45)
                 st.plotly_chart(fig_delay, use_container_width=True)
             else:
                 st.info("No projects are currently delayed!")
         
         # Project timeline table
         st.subheader("📅 Project Timeline Details")
-        timeline_data = self.projects[['project_name', 'status', 'phase', 'progress', 'days_remaining']].copy()
-        timeline_data['days_remaining'] = timeline_data['days_remaining'].astype(int)
-        timeline_data = timeline_data.sort_values('days_remaining')
+        timeline_data = projects.loc[
+            :, ['project_name', 'status', 'phase', 'progress', 'days_remaining']
+        ].sort_values('days_remaining')
         st.dataframe(timeline_data, use_container_width=True)
     
     def render_stakeholder_feedback(self):
@@ -296,20 +438,13 @@ class ProjectAnalyticsDashboard:
         with col1:
             # Feedback sentiment over time
             feedback_timeline = self.stakeholder_feedback.groupby([
-                self.stakeholder_feedback["date"].dt.date, "sentiment"
-            ]).size().reset_index(name="count")
+                pd.Grouper(key="date", freq="D"), "sentiment"
+            ], observed=True).size().reset_index(name="count")
             
-            fig_sentiment = px.line(
-                feedback_timeline,
-                x="date",
-                y="count",
-                color="sentiment",
-                title="Stakeholder Feedback Sentiment Trends",
-                color_discrete_map={
-                    "Positive": "#27ae60",
-                    "Neutral": "#3498db",
-                    "Negative": "#e74c3c"
-                }
+            fig_sentiment = _fig_sentiment(
+                feedback_timeline["date"].to_numpy(),
+                tuple(feedback_timeline["sentiment"]),
+                feedback_timeline["count"].to_numpy()
             )
             st.plotly_chart(fig_sentiment, use_container_width=True)
         
@@ -317,53 +452,35 @@ class ProjectAnalyticsDashboard:
             # Feedback by category
             feedback_category = self.stakeholder_feedback.groupby([
                 "feedback_type", "sentiment"
-            ]).size().reset_index(name="count")
+            ], observed=True).size().reset_index(name="count")
             
-            fig_category = px.bar(
-                feedback_category,
-                x="feedback_type",
-                y="count",
-                color="sentiment",
-                title="Feedback Distribution by Category",
-                color_discrete_map={
-                    "Positive": "#27ae60",
-                    "Neutral": "#3498db",
-                    "Negative": "#e74c3c"
-                }
+            fig_category = _fig_category(
+                tuple(feedback_category["feedback_type"]),
+                tuple(feedback_category["sentiment"]),
+                feedback_category["count"].to_numpy()
             )
             st.plotly_chart(fig_category, use_container_width=True)
     
-    def render_risk_analysis(self):
+    def render_risk_analysis(self, projects):
         """Render detailed risk analysis"""
         st.subheader("⚠️ Risk Analysis & Early Warning System")
         
-        # Identify high-risk projects
-        high_risk_projects = self.projects[
-            (self.projects["risk_level"] == "High") |
-            (self.projects["budget_utilization"] > 90) |
-            (self.projects["delay_days"] > 30)
-        ].copy()
+        # High-risk projects are flagged once on the full frame at construction
+        high_risk_projects = projects[projects["high_risk"]]
         
         if not high_risk_projects.empty:
             st.warning(f"🚨 {len(high_risk_projects)} projects require immediate attention!")
             
             # Risk matrix
-            fig_risk_matrix = px.scatter(
-                self.projects,
-                x="budget_utilization",
-                y="delay_days",
-                size="team_size",
-                color="risk_level",
-                hover_data=["project_name", "health_score"],
-                title="Risk Matrix: Budget Utilization vs Delays",
-                color_discrete_map={"High": "#e74c3c", "Medium": "#f39c12", "Low": "#27ae60"}
+            fig_risk_matrix = _fig_risk_matrix(
+                tuple(projects["project_name"]),
+                projects["budget_utilization"].to_numpy(),
+                projects["delay_days"].to_numpy(),
+                projects["team_size"].to_numpy(),
+                tuple(projects["risk_level"]),
+                projects["health_score"].to_numpy()
             )
             
-            fig_risk_matrix.add_vline(x=100, line_dash="dash", line_color="red")
-            fig_risk_matrix.add_hline(y=30, line_dash="dash", line_color="red")
-            fig_risk_matrix.add_annotation(x=110, y=45, text="High Risk Zone", 
-                                         showarrow=False, bgcolor="rgba(255,0,0,0.1)")
-            
             st.plotly_chart(fig_risk_matrix, use_container_width=True)
             
             # High-risk projects table
@@ -371,25 +488,31 @@ class ProjectAnalyticsDashboard:
             risk_display = high_risk_projects[[
                 "project_name", "status", "risk_level", "budget_utilization", 
                 "delay_days", "health_score"
-            ]].copy()
-            risk_display["health_score"] = risk_display["health_score"].round(1)
-            risk_display["budget_utilization"] = risk_display["budget_utilization"].round(1)
+            ]]
             
-            st.dataframe(risk_display, use_container_width=True)
+            # Format at display time so the underlying columns are not rewritten
+            st.dataframe(
+                risk_display,
+                use_container_width=True,
+                column_config={
+                    "health_score": st.column_config.NumberColumn(format="%.1f"),
+                    "budget_utilization": st.column_config.NumberColumn(format="%.1f")
+                }
+            )
         else:
             st.success("✅ No high-risk projects identified!")
     
-    def render_project_details(self):
+    def render_project_details(self, projects):
         """Render detailed project information"""
         st.subheader("📋 Project Details")
         
         # Project selector
         selected_project = st.selectbox(
             "Select a project for detailed analysis:",
-            self.projects["project_name"].tolist()
+            projects["project_name"].tolist()
         )
         
-        project_data = self.projects[self.projects["project_name"] == selected_project].iloc[0]
+        project_data = projects[projects["project_name"] == selected_project].iloc[0]
         
         col1, col2, col3 = st.columns(3)
         
@@ -405,7 +528,7 @@ class ProjectAnalyticsDashboard:
         
         with col3:
             st.metric("Risk Level", project_data["risk_level"])
-            st.metric("Health Score", f"{self.calculate_health_score(project_data):.1f}")
+            st.metric("Health Score", f"{project_data['health_score']:.1f}")
             st.metric("Days Remaining", project_data["days_remaining"])
         
         # Project-specific feedback
@@ -415,10 +538,15 @@ class ProjectAnalyticsDashboard:
         
         if not project_feedback.empty:
             st.subheader("Recent Stakeholder Feedback")
-            for _, feedback in project_feedback.head(3).iterrows():
-                sentiment_color = {"Positive": "🟢", "Neutral": "🟡", "Negative": "🔴"}
-                st.write(f"{sentiment_color[feedback['sentiment']]} **{feedback['feedback_type']}** "
-                        f"(Rating: {feedback['rating']}/5) - {feedback['comment']}")
+            sentiment_color = {"Positive": "🟢", "Neutral": "🟡", "Negative": "🔴"}
+            recent_feedback = project_feedback.head(3)
+            recent_feedback = recent_feedback.assign(icon=recent_feedback["sentiment"].map(sentiment_color))
+            rows = recent_feedback[
+                ["icon", "feedback_type", "rating", "comment"]
+            ].itertuples(index=False, name=None)
+            for icon, feedback_type, rating, comment in rows:
+                st.write(f"{icon} **{feedback_type}** "
+                        f"(Rating: {rating}/5) - {comment}")
 
 def main():
     st.title("📊 Project Lifecycle Analytics Dashboard")
@@ -433,44 +561,49 @@ def main():
     # Status filter
     status_filter = st.sidebar.multiselect(
         "Project Status",
-        options=dashboard.projects["status"].unique(),
-        default=dashboard.projects["status"].unique()
+        options=dashboard.projects["status"].unique().tolist(),
+        default=dashboard.projects["status"].unique().tolist()
     )
     
     # Risk filter
     risk_filter = st.sidebar.multiselect(
         "Risk Level",
-        options=dashboard.projects["risk_level"].unique(),
-        default=dashboard.projects["risk_level"].unique()
+        options=dashboard.projects["risk_level"].unique().tolist(),
+        default=dashboard.projects["risk_level"].unique().tolist()
     )
     
-    # Apply filters
-    filtered_projects = dashboard.projects[
-        (dashboard.projects["status"].isin(status_filter)) &
-        (dashboard.projects["risk_level"].isin(risk_filter))
-    ]
-    dashboard.projects = filtered_projects
+    # Apply filters as a view; the full frame (and its health scores) stays untouched
+    projects = dashboard.projects
+    mask = projects["status"].isin(status_filter) & projects["risk_level"].isin(risk_filter)
+    filtered_projects = projects.loc[mask]
     
     # Main dashboard sections
-    dashboard.render_overview_metrics()
-    
-    st.divider()
-    dashboard.render_project_health_overview()
-    
-    st.divider()
-    dashboard.render_cost_analysis()
+    dashboard.render_overview_metrics(filtered_projects)
     
     st.divider()
-    dashboard.render_timeline_analysis()
     
-    st.divider()
-    dashboard.render_stakeholder_feedback()
-    
-    st.divider()
-    dashboard.render_risk_analysis()
+    # Only the selected section runs, so hidden sections build no figures on a rerun
+    section = st.radio(
+        "Dashboard section",
+        ["Health", "Cost", "Timeline", "Feedback", "Risk", "Details"],
+        horizontal=True,
+        label_visibility="collapsed"
+    )
     
-    st.divider()
-    dashboard.render_project_details()
+    if section == "Health":
+        risk_counts = count_observed(filtered_projects["risk_level"])
+        dashboard.render_project_health_overview(filtered_projects, risk_counts)
+    elif section == "Cost":
+        dashboard.render_cost_analysis(filtered_projects)
+    elif section == "Timeline":
+        status_counts = count_observed(filtered_projects["status"])
+        dashboard.render_timeline_analysis(filtered_projects, status_counts)
+    elif section == "Feedback":
+        dashboard.render_stakeholder_feedback()
+    elif section == "Risk":
+        dashboard.render_risk_analysis(filtered_projects)
+    elif section == "Details":
+        dashboard.render_project_details(filtered_projects)
     
     # Footer
     st.markdown("---")